@@ -43,7 +43,11 @@ DOCUMENTATION = r'''
         type: bool
         default: false
       filter:
-        description: Optional WHERE filter used when querying the Orion.Nodes table to filter out hosts.
+        description:
+          - Optional filter used when querying the Orion.Nodes table, aliased as C(node), to filter out hosts.
+          - It can start with JOIN clauses, followed by an optional WHERE clause and an optional ORDER BY clause,
+            for example C(INNER JOIN Orion.NodesCustomProperties c ON c.NodeID = node.NodeID WHERE c.City = 'X').
+          - Nodes with an empty I(hostname_field) are always filtered out as well.
         required: false
         type: string
       hostname_field:
@@ -71,6 +75,18 @@ DOCUMENTATION = r'''
         required: false
         type: list
         elements: string
+      page_size:
+        description:
+          - Number of nodes to request from the Solarwinds Information Service API per query.
+          - Nodes are requested in pages ordered by NodeID, so only one page of results is held in memory at a time.
+          - Every page excludes nodes with an empty I(hostname_field) and applies I(filter).
+          - Paging is used when I(filter) is unset or a single WHERE clause, such as C(WHERE Vendor = 'Cisco').
+          - A filter with a JOIN or ORDER BY clause is sent as a single query.
+          - Set to 0 to request all nodes with a single query.
+        required: false
+        type: int
+        default: 1000
+        version_added: "2.2.0"
 '''
 
 EXAMPLES = r'''
@@ -98,41 +114,31 @@ keyed_groups:
   - key: orion_Server_Environment
     prefix: env
 
+# Nodes of the whole inventory are resolved in one query, so NodeID can be pulled in as well
+# and passed to the modules as node_id: "{{ orion_NodeID }}", which selects the node by its key
+---
+plugin: solarwinds.orion.orion_nodes_inventory
+orion_hostname: orion.hostname.com
+orion_username: Ansible
+orion_password: changeme
+hostname_field: Caption
+hostvar_fields:
+  - NodeID
+
 '''
 
+import inspect
+import re
+
 from ansible.errors import AnsibleError, AnsibleParserError
 from ansible.module_utils._text import to_text, to_native
 from ansible.utils.display import Display
-from ansible.parsing.yaml.objects import AnsibleVaultEncryptedUnicode
-from ansible.module_utils.six import raise_from
-try:
-    from ansible.module_utils.compat.version import LooseVersion  # noqa: F401
-except ImportError:
-    try:
-        from distutils.version import LooseVersion  # noqa: F401
-    except ImportError as exc:
-        raise_from(ImportError('To use this plugin or module with ansible-core'
-                               ' < 2.11, you need to use Python < 3.12 with '
-                               'distutils.version present'), exc)
 
 display = Display()
 
-# 3rd party imports
-try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-
-try:
-    import orionsdk
-    from orionsdk import SwisClient
-    HAS_ORION = True
-except ImportError:
-    HAS_ORION = False
+# Splits a filter into the JOIN clauses before its WHERE, the WHERE condition and a trailing ORDER BY clause,
+# which can't hold a quote so an ORDER BY inside a string literal is never split off
+FILTER_RE = re.compile(r"^\s*(.*?)\s*(?:\bWHERE\s+(.+?))?\s*(?:\b(ORDER\s+BY\s+[^']+?))?\s*$", re.IGNORECASE | re.DOTALL)
 
 from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 
@@ -140,18 +146,25 @@ from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructa
 class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
     NAME = 'solarwinds.orion.orion_nodes_inventory'
 
+    _VALID_SUFFIXES = ('orion.yaml', 'orion.yml', 'solarwinds.yaml', 'solarwinds.yml')
+
+    # urllib3 warnings only need to be disabled once per process
+    _warnings_disabled = False
+    # Whether SwisClient accepts port and verify (orionsdk > 0.3.0), probed on first connection
+    _swis_has_port_arg = None
+
     def __init__(self):
         super(InventoryModule, self).__init__()
-        if not HAS_ORION:
-            raise AnsibleError('Missing python module: orionsdk')
-        if not HAS_REQUESTS:
-            raise AnsibleError('Missing python module: requests')
+
+        # Reused across parse() calls on the same plugin instance
+        self._swis_cache = {}
+        self._query_cache = {}
 
     def verify_file(self, path):
         """ return true/false if this is possibly a valid file for this plugin to consume """
         valid = False
         if super(InventoryModule, self).verify_file(path):
-            if path.endswith(('orion.yaml', 'orion.yml', 'solarwinds.yaml', 'solarwinds.yml')):
+            if path.endswith(self._VALID_SUFFIXES):
                 valid = True
             else:
                 self.display.vvv("Inventory source doesn't match 'solarwinds' or 'orion', skipping...")
@@ -165,129 +178,264 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
 
             self._consume_options(config)
         except Exception as e:
-            raise AnsibleParserError('Failed to consume options:    {0}'.format(to_native(e)))
+            raise AnsibleParserError(f'Failed to consume options:    {to_native(e)}')
+
+        self._hostvar_fields = (
+            tuple(self.get_option('hostvar_fields') or ())
+            + tuple(self.get_option('hostvar_custom_properties') or ())
+        )
+        self._prefix = self.get_option('hostvar_prefix')
+        # Map of raw field name to host variable name, built once instead of per host
+        self._prefixed = {field: self._prefix + field for field in self._hostvar_fields}
+        # Constructed options, empty ones are skipped for every host
+        self._constructed_compose = self.get_option('compose') or None
+        self._constructed_groups = self.get_option('groups') or None
+        self._constructed_keyed_groups = self.get_option('keyed_groups') or None
+        self._constructed_strict = self.get_option('strict')
 
         cache_key = self.get_cache_key(path)
-        update_cache = False
-
-        if cache:
+        user_cache_setting = self.get_option('cache')
+        # only read the cache when the plugin has one and the caller allows it,
+        # a refresh (cache=False) still writes new results to an enabled cache
+        attempt_to_read_cache = user_cache_setting and cache
+        cache_needs_update = user_cache_setting and not cache
+        cacheable_results = None
+
+        if attempt_to_read_cache:
             try:
                 self.display.vvv("Getting cached data...")
                 cacheable_results = self._cache[cache_key]
                 self.display.vvv("Got cached data...")
             except KeyError:
                 self.display.vvv("Cache needs updating...")
-                update_cache = True
+                cache_needs_update = True
 
-        if cache and not update_cache:
-            self.display.vvv("Populating from cache...")
-            self._populate_from_cache(cacheable_results)
-        else:
-            self.display.vvv("Populating from source...")
-            cacheable_results = self._populate_from_source()
+        if cacheable_results is None:
+            self.display.vvv("Getting hosts from source...")
+            cacheable_results = self._get_hostvars_from_source()
 
-        if update_cache or (not cache and self.get_option('cache')):
+        if cache_needs_update:
             self.display.vvv("Updating cache data...")
             self._cache[cache_key] = cacheable_results
 
-    def _populate_from_cache(self, cache_data):
+        self.display.vvv("Populating inventory...")
+        self._populate(cacheable_results)
+
+    def _populate(self, inv_hostvars):
         """
-        Populate cache using source data
+        Add hosts to the inventory from a mapping of hostname to host variables,
+        from either the cache or the source
 
         """
-        for host, host_properties in cache_data.items():
+        for host, host_properties in inv_hostvars.items():
             self.add_host(host, host_properties)
 
-    def _populate_from_source(self):
+    def _get_hostvars_from_source(self):
         inv_hostvars = {}
 
-        data = self.get_orion_nodes()
-
-        if data:
-            self.display.vvv("Building inventory from query data...")
-            for node in data:
-                try:
-                    node_hostvars = {}
-                    node_hostname = node[self.get_option('hostname_field')]
-
-                    for hostvar in self.get_option('hostvar_fields'):
-                        node_hostvars[hostvar] = node[hostvar]
-
-                    if self.get_option('hostvar_custom_properties'):
-                        for custom_property in self.get_option('hostvar_custom_properties'):
-                            node_hostvars[custom_property] = node[custom_property]
+        self.display.vvv("Building inventory from query data...")
+        # Resolve options once, they don't change between nodes
+        hostname_field = self.get_option('hostname_field')
+        keep_hostname = hostname_field in self._hostvar_fields
 
-                    inv_hostvars[node_hostname] = node_hostvars
-                    self.add_host(node_hostname, node_hostvars)
-                except Exception as e:
-                    raise AnsibleParserError('Error iterating over query results: {0}'.format(to_native(e)))
+        try:
+            for node in self.get_orion_nodes():
+                # Rows only hold the selected columns, so each one is reused as the host's variables
+                # rather than copied, once the hostname is removed when it isn't also a host variable
+                if keep_hostname:
+                    node_hostname = node[hostname_field]
+                else:
+                    node_hostname = node.pop(hostname_field)
+                inv_hostvars[node_hostname] = node
+        except KeyError as e:
+            raise AnsibleParserError(f'Error iterating over query results, missing field {to_native(e)}')
 
         return inv_hostvars
 
     def get_orion_nodes(self):
-        orion_password = self.get_option('orion_password')
-        if isinstance(orion_password, AnsibleVaultEncryptedUnicode):
-            orion_password = orion_password.data
+        """ yield the queried nodes, requesting them from SWIS one page at a time when paging is enabled """
+        swis = self.get_swis_client()
+        query, page_size, strip_node_id = self.get_query()
+
+        if self.display.verbosity >= 3:
+            self.display.vvv(f'Using query "{to_text(query)}"')
+
+        if not page_size:
+            for node in self._query(swis, query)['results']:
+                yield node
+            return
+
+        last_node_id = 0
+        while True:
+            nodes = self._query(swis, query, last_node_id=last_node_id)['results']
+            if not nodes:
+                break
+            last_node_id = nodes[-1]['NodeID']
+            for node in nodes:
+                if strip_node_id:
+                    del node['NodeID']
+                yield node
+            if len(nodes) < page_size:
+                break
+
+    @staticmethod
+    def _query(swis, query, **params):
+        """ run a SWQL query, the node query is the first request to Orion so it is where bad credentials surface """
+        import requests
+
         try:
-            if LooseVersion(orionsdk.__version__) <= LooseVersion('0.3.0'):
-                swis_options = {
-                    'hostname': self.get_option('orion_hostname'),
-                    'username': self.get_option('orion_username'),
-                    'password': orion_password,
-                }
-            else:
-                swis_options = {
-                    'hostname': self.get_option('orion_hostname'),
-                    'username': self.get_option('orion_username'),
-                    'password': orion_password,
-                    'port': self.get_option('orion_port'),
-                    'verify': self.get_option('verify'),
-                }
-            __SWIS__ = SwisClient(**swis_options)
-            __SWIS__.query('SELECT uri FROM Orion.Environment')
+            return swis.query(query, **params)
         except Exception as e:
-            raise AnsibleError('Failed to connect to Orion database:   {0}'.format(to_native(e)))
-
-        hostname_field = self.get_option('hostname_field')
-        select_string = "SELECT NodeID, node.{0}".format(hostname_field)
-        for hostvar_field in self.get_option('hostvar_fields'):
-            select_string = select_string + ", node.{0}".format(hostvar_field)
-        if self.get_option('hostvar_custom_properties'):
-            for custom_property in self.get_option('hostvar_custom_properties'):
-                select_string = select_string + ", custom.{0} as {0}".format(custom_property)
+            response = getattr(e, 'response', None)
+            if isinstance(e, requests.exceptions.ConnectionError) or (response is not None and response.status_code in (401, 403)):
+                raise AnsibleError(f'Failed to connect to Orion database: {to_native(e)}')
+            # orionsdk puts the server's error message in the exception, e.g. for a SWQL syntax error in the filter
+            raise AnsibleError(f'Failed to query Orion: {to_native(e)}')
+
+    def get_swis_client(self):
+        """ return a connected SwisClient, reusing the one from a previous parse when the connection options match """
+        connection_key = (
+            self.get_option('orion_hostname'),
+            self.get_option('orion_username'),
+            self.get_option('orion_port'),
+            self.get_option('verify'),
+        )
+        if connection_key in self._swis_cache:
+            return self._swis_cache[connection_key]
+
+        # 3rd party imports are deferred until a connection is needed,
+        # so inventory sources skipped by verify_file don't pay for them
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+        except ImportError:
+            raise AnsibleError('Missing python module: requests')
+        try:
+            from orionsdk import SwisClient
+        except ImportError:
+            raise AnsibleError('Missing python module: orionsdk')
 
-        query = "{0} FROM Orion.Nodes as node ".format(select_string)
+        if InventoryModule._swis_has_port_arg is None:
+            InventoryModule._swis_has_port_arg = 'port' in inspect.signature(SwisClient).parameters
 
-        if self.get_option('hostvar_custom_properties'):
-            query = query + "LEFT JOIN Orion.NodesCustomProperties as custom on node.NodeID = custom.NodeID "
+        # Old orionsdk versions never verify certificates, so they warn just like verify=False
+        verify = self.get_option('verify') and InventoryModule._swis_has_port_arg
+        if not verify and not InventoryModule._warnings_disabled:
+            urllib3 = requests.packages.urllib3
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            InventoryModule._warnings_disabled = True
 
-        if self.get_option('filter'):
-            query = query + self.get_option('filter')
+        # A vaulted password is decrypted by converting it to text, the client is cached so this only runs once
+        orion_password = to_text(self.get_option('orion_password'))
+        try:
+            swis_options = {
+                'hostname': self.get_option('orion_hostname'),
+                'username': self.get_option('orion_username'),
+                'password': orion_password,
+            }
+            if InventoryModule._swis_has_port_arg:
+                swis_options['port'] = self.get_option('orion_port')
+                swis_options['verify'] = self.get_option('verify')
+            # Keep-alive connections are pooled on the session, so every page of the
+            # query and every later parse() reuses the same TLS connection
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(pool_maxsize=8, max_retries=1))
+            swis_options['session'] = session
+            __SWIS__ = SwisClient(**swis_options)
+        except Exception as e:
+            raise AnsibleError(f'Failed to connect to Orion database: {to_native(e)}')
 
-        self.display.vvv('Using query "{0}"'.format(to_text(query)))
+        self._swis_cache[connection_key] = __SWIS__
+        return __SWIS__
 
-        results = __SWIS__.query(query)
+    def get_query(self):
+        """
+        return the SWQL query for the configured fields and filter, the page size to request it with
+        and whether the NodeID column was only added for paging, building it only once per set of options
 
-        return results['results']
+        """
+        hostname_field = self.get_option('hostname_field')
+        query_key = (
+            hostname_field,
+            tuple(self.get_option('hostvar_fields') or ()),
+            tuple(self.get_option('hostvar_custom_properties') or ()),
+            self.get_option('filter'),
+            self.get_option('page_size'),
+        )
+        if query_key in self._query_cache:
+            return self._query_cache[query_key]
+
+        hostvar_fields, custom_properties, query_filter, page_size = query_key[1:]
+
+        # The JOINs of the filter go before the query's own WHERE, its condition is combined with
+        # the query's conditions and its ORDER BY is appended after them
+        filter_joins = filter_condition = filter_order = None
+        if query_filter:
+            filter_joins, filter_condition, filter_order = FILTER_RE.match(query_filter).groups()
+            if (filter_joins or filter_order) and page_size:
+                # Pages are ordered by NodeID, and a JOIN can return several rows for one node,
+                # so either needs a single query
+                self.display.vvv("Filter is not a single WHERE clause, requesting all nodes in one query...")
+                page_size = 0
+
+        # Nodes without a hostname can't be added to the inventory, let SWIS drop them
+        conditions = ["node.{0} IS NOT NULL AND node.{0} <> ''".format(hostname_field)]
+        if page_size:
+            conditions.insert(0, "node.NodeID > @last_node_id")
+        if filter_condition:
+            conditions.append("({0})".format(filter_condition))
+
+        columns = ["node." + hostname_field]
+        # NodeID is only selected as the paging cursor, and dropped from the rows unless it was asked for
+        strip_node_id = bool(page_size) and 'NodeID' not in (hostname_field,) + hostvar_fields
+        if strip_node_id:
+            columns.insert(0, "node.NodeID")
+        columns.extend("node." + hostvar_field for hostvar_field in hostvar_fields)
+        columns.extend("custom.{0} as {0}".format(custom_property) for custom_property in custom_properties)
+
+        if page_size:
+            query_parts = ["SELECT TOP {0}".format(page_size), ", ".join(columns), "FROM Orion.Nodes as node"]
+        else:
+            query_parts = ["SELECT", ", ".join(columns), "FROM Orion.Nodes as node"]
+        if custom_properties:
+            query_parts.append("LEFT JOIN Orion.NodesCustomProperties as custom on node.NodeID = custom.NodeID")
+        if filter_joins:
+            query_parts.append(filter_joins)
+        query_parts.append("WHERE " + " AND ".join(conditions))
+        if page_size:
+            query_parts.append("ORDER BY node.NodeID")
+        elif filter_order:
+            query_parts.append(filter_order)
+
+        query = " ".join(query_parts)
+        self._query_cache[query_key] = (query, page_size, strip_node_id)
+        return query, page_size, strip_node_id
 
     def add_host(self, hostname, hostvars):
         self.inventory.add_host(hostname, group='all')
+        # Resolve the host once instead of looking it up by name for every variable
+        host = self.inventory.get_host(hostname)
 
         for var_name, var_value in hostvars.items():
-            var_name = "{0}{1}".format(self.get_option('hostvar_prefix'), var_name)
             try:
-                self.inventory.set_variable(hostname, var_name, var_value)
+                var_name = self._prefixed[var_name]
+            except KeyError:
+                # cached data may hold fields that are no longer configured
+                var_name = self._prefixed[var_name] = self._prefix + var_name
+            try:
+                host.set_variable(var_name, var_value)
             except ValueError as e:
-                self.display.warning("Could not set hostvar {0} to {1} for the {2} host, skipping:  {3}".format(
-                    var_name, to_native(var_value), hostname, to_native(e)
-                ))
-
-        strict = self.get_option('strict')
+                self.display.warning(
+                    f"Could not set hostvar {var_name} to {to_native(var_value)} for the {hostname} host, skipping:  {to_native(e)}"
+                )
 
         # Add variables created by the user's Jinja2 expressions to the host
-        self._set_composite_vars(self.get_option('compose'), hostvars, hostname, strict=True)
+        if self._constructed_compose:
+            self._set_composite_vars(self._constructed_compose, hostvars, hostname, strict=True)
 
         # Create user-defined groups using variables and Jinja2 conditionals
-        self._add_host_to_composed_groups(self.get_option('groups'), hostvars, hostname, strict=strict)
+        if self._constructed_groups:
+            self._add_host_to_composed_groups(self._constructed_groups, hostvars, hostname, strict=self._constructed_strict)
         # need to format group name, remove or replace spaces and make lowercase
-        self._add_host_to_keyed_groups(self.get_option('keyed_groups'), hostvars, hostname, strict=strict)
+        if self._constructed_keyed_groups:
+            self._add_host_to_keyed_groups(self._constructed_keyed_groups, hostvars, hostname, strict=self._constructed_strict)
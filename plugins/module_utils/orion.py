@@ -8,7 +8,9 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible.module_utils.six import raise_from
+from datetime import datetime
 import re
+import threading
 try:
     from ansible.module_utils.compat.version import LooseVersion  # noqa: F401
 except ImportError:
@@ -19,22 +21,136 @@ except ImportError:
                                ' < 2.11, you need to use Python < 3.12 with '
                                'distutils.version present'), exc)
 
-try:
-    from dateutil.parser import parse
-    HAS_DATEUTIL = True
-except ImportError:
-    HAS_DATEUTIL = False
-except Exception:
-    raise Exception
-
 try:
     import orionsdk
     from orionsdk import SwisClient
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_FUTURES = True
+except ImportError:
+    HAS_FUTURES = False
+
+# Authenticated clients reused by every OrionModule in this process with the same connection options
+_SWIS_CLIENTS = {}
+# Name to ID lookups shared by every OrionModule in this process, per Orion server and kind of ID
+_NAME_ID_CACHES = {}
+_WARNINGS_DISABLED = False
+# Threads used by OrionModule.submit, the session pool keeps one connection per thread
+_MAX_WORKERS = 4
+# Marks the submit() worker threads, which must never call fail_json themselves
+_WORKER = threading.local()
+
+
+def disable_insecure_warnings():
+    """Silence urllib3's InsecureRequestWarning for servers used with verify=False, once per process."""
+    global _WARNINGS_DISABLED
+    if HAS_REQUESTS and not _WARNINGS_DISABLED:
+        urllib3 = requests.packages.urllib3
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        _WARNINGS_DISABLED = True
+
+
+def swis_session():
+    """Return a pooled requests session for a SWIS client.
+
+    Each client gets its own session, since SwisClient sets the credentials on it.
+    All requests go to the one Orion server, so a single pool sized for the submit()
+    threads plus the main thread keeps every connection alive between calls.
+    Retries use urllib3's default allowed methods, so failed connections are retried
+    but SWIS create/update/invoke requests, which are POSTs, are never sent twice.
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=_MAX_WORKERS + 1,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    ))
+    return session
+
+
+# Node info keys copied as is from the Orion.Nodes columns of the same name
+_NODE_FIELD_MAP = (
+    ('nodeid', 'NodeID'),
+    ('caption', 'Caption'),
+    ('unmanaged', 'Unmanaged'),
+    ('uri', 'Uri'),
+    ('objectsubtype', 'ObjectSubType'),
+    ('ipaddress', 'IP_Address'),
+    ('status', 'Status'),
+    ('statusdescription', 'StatusDescription'),
+    ('lastsystemuptimepollutc', 'LastSystemUptimePollUtc'),
+)
+_NODE_COLUMNS = [column for key, column in _NODE_FIELD_MAP] + ['UnManageFrom', 'UnManageUntil']
+_NODE_FIELDS = ', '.join(_NODE_COLUMNS)
+# Same columns qualified with the n alias, for queries joining Orion.Nodes to another entity
+_NODE_FIELDS_QUALIFIED = ', '.join('n.' + node_column for node_column in _NODE_COLUMNS)
+
+# Module parameters that select a node, in order of precedence, and the Orion.Nodes column each matches
+_NODE_SELECTORS = (
+    ('node_id', 'NodeID'),
+    ('ip_address', 'IPAddress'),
+    ('name', 'Caption'),
+)
+
+# Custom property names are formatted into queries as column names, so they must be plain identifiers
+_IDENT_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*\Z')
+
+_VOLUME_FIELDS = (
+    'volumeid', 'displayname', 'volumeindex', 'status', 'type', 'caption', 'pollinterval',
+    'statcollection', 'rediscoveryinterval', 'volumedescription', 'icon', 'uri',
+)
+
+_VOLUME_TYPE_ID = {
+    "Other": 1,
+    "RAM": 2,
+    "Virtual Memory": 3,
+    "Fixed Disk": 4,
+}
+
+# Queries with a fixed shape are built once at import, only their bind values change per call
+_NODE_QUERY = "SELECT {0} FROM Orion.Nodes WHERE {1} = @value"
+_NODE_QUERIES = dict(
+    (param, _NODE_QUERY.format(_NODE_FIELDS, column)) for param, column in _NODE_SELECTORS
+)
+# Node joined to its hardware health sensors, columns are qualified since both entities have a Uri
+_NODE_HARDWARE_HEALTH_QUERY = (
+    "SELECT {0}, h.PollingMethod AS HardwareHealthPollingMethod FROM Orion.Nodes n "
+    "LEFT JOIN Orion.HardwareHealth.HardwareInfoBase h ON h.ParentObjectID = n.NodeID WHERE n.{1} = @value"
+)
+_NODE_HARDWARE_HEALTH_QUERIES = dict(
+    (param, _NODE_HARDWARE_HEALTH_QUERY.format(_NODE_FIELDS_QUALIFIED, column))
+    for param, column in _NODE_SELECTORS
+)
+_VOLUME_QUERY = "SELECT {0} FROM Orion.Volumes WHERE nodeid = @node_id AND caption = @caption".format(
+    ', '.join(_VOLUME_FIELDS)
+)
+
+
+def _iso(value):
+    """Normalize a SWIS timestamp to ISO 8601.
+
+    SWIS already returns ISO 8601, which datetime.fromisoformat reads far faster than dateutil.
+    dateutil is kept for what fromisoformat can't read, such as 7 digit fractions before
+    Python 3.11, and for Python 2 which has no fromisoformat.
+    """
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).isoformat()
+    except (AttributeError, ValueError):
+        # Only imported when needed, most timestamps never reach the fallback
+        from dateutil.parser import parse
+        return parse(value).isoformat()
 
 
 def orion_argument_spec():
@@ -50,8 +166,51 @@ def orion_argument_spec():
     )
 
 
+class _SwisConnectionError(Exception):
+    """Auth or connection failure of a query run by a submit() worker, reported when its result is read."""
+
+
+def _run_in_worker(func, *args, **kwargs):
+    _WORKER.active = True
+    return func(*args, **kwargs)
+
+
+class _WorkerFuture:
+    """Future of a submit() call, failing the module from the thread that reads its result."""
+
+    def __init__(self, module, future):
+        self._module = module
+        self._future = future
+
+    def result(self):
+        try:
+            return self._future.result()
+        except _SwisConnectionError as e:
+            self._module.fail_json(msg=str(e))
+
+
+class _CompletedCall:
+    """Result of a call run synchronously, for when concurrent.futures is unavailable (Python 2)."""
+
+    def __init__(self, func, *args, **kwargs):
+        self._result = None
+        self._exception = None
+        try:
+            self._result = func(*args, **kwargs)
+        except Exception as e:
+            self._exception = e
+
+    def result(self):
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+
 class OrionModule:
 
+    # Bounded pool for overlapping independent SWIS queries, created on first use
+    _executor = None
+
     def __init__(self, module):
         self.module = module
         self.orionsdk_version = orionsdk.__version__
@@ -69,78 +228,181 @@ class OrionModule:
                 'port': module.params['port'],
                 'verify': module.params['verify'],
             }
+        # Old orionsdk versions never verify certificates, so they warn just like verify=False
+        if not self.swis_options.get('verify'):
+            disable_insecure_warnings()
+
+        # IDs looked up by name don't change on the server, so each name is only queried once per process
+        name_ids = _NAME_ID_CACHES.setdefault((module.params['hostname'], module.params['port']), {})
+        self._poller_id_cache = name_ids.setdefault('CustomPollerID', {})
+        self._app_tpl_cache = name_ids.setdefault('ApplicationTemplateID', {})
+        self._apm_credential_cache = name_ids.setdefault('APMCredentialID', {})
+        self._credential_cache = name_ids.setdefault('CredentialID', {})
+        self._ncm_node_cache = {}
+        # Node selected by the module parameters, cached once found
+        self._node = None
+
+        # Credentials aren't probed up front, swis_query reports auth failures of the first real query
+        client_key = tuple(sorted(self.swis_options.items()))
+        self.swis = _SWIS_CLIENTS.get(client_key)
+        if self.swis is not None:
+            return
+
+        if HAS_REQUESTS:
+            self.swis_options['session'] = swis_session()
         self.swis = SwisClient(**self.swis_options)
+        _SWIS_CLIENTS[client_key] = self.swis
 
-        try:
-            self.swis.query('SELECT uri FROM Orion.Environment')
-        except Exception as AuthException:
-            self.module.fail_json(
-                msg='Failed to query Orion. '
-                    'Check Hostname, Username, and/or Password: {0}'.format(str(AuthException))
-            )
+    def submit(self, func, *args, **kwargs):
+        """Run a query method in the background and return a future for its result.
 
-    def swis_query(self, query):
-        results = self.swis.query(query)
-        if results['results']:
-            return results['results']
+        Independent lookups submitted together overlap their round trips to SWIS.
+        Without concurrent.futures the call runs immediately and the returned object
+        only provides result(). Auth and connection failures of a background query
+        only fail the module once result() is called, so fail_json is never called
+        off the main thread.
+        """
+        if not HAS_FUTURES:
+            return _CompletedCall(func, *args, **kwargs)
+        if OrionModule._executor is None:
+            OrionModule._executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
+        return _WorkerFuture(self.module, OrionModule._executor.submit(_run_in_worker, func, *args, **kwargs))
+
+    def swis_query(self, query, **params):
+        """Run a SWQL query and return its result rows, an empty list when nothing matched."""
+        try:
+            return self.swis.query(query, **params)['results']
+        except Exception as SwisException:
+            response = getattr(SwisException, 'response', None)
+            unreachable = HAS_REQUESTS and isinstance(SwisException, requests.exceptions.ConnectionError)
+            if unreachable or (response is not None and response.status_code in (401, 403)):
+                msg = 'Failed to query Orion. Check Hostname, Username, and/or Password: {0}'.format(SwisException)
+                if getattr(_WORKER, 'active', False):
+                    raise _SwisConnectionError(msg)
+                self.module.fail_json(msg=msg)
+            raise
 
     def swis_get_ncm_connection_profiles(self):
         """Find all available connection profiles and return a list."""
         profile_list = self.swis.invoke('Cirrus.Nodes', 'GetAllConnectionProfiles')
         return profile_list
 
+    def _query_node(self, extra_fields=''):
+        for param, column in _NODE_SELECTORS:
+            if self.module.params[param]:
+                if extra_fields:
+                    query = _NODE_QUERY.format(_NODE_FIELDS + extra_fields, column)
+                else:
+                    query = _NODE_QUERIES[param]
+                results = self.swis_query(query, value=self.module.params[param])
+                if results:
+                    return results[0]
+                return None
+
+    def _node_from_result(self, result):
+        node = {key: result[column] for key, column in _NODE_FIELD_MAP}
+        # Normalized once here, so lookups bind it as an int and use the NodeID index
+        node['nodeid'] = int(node['nodeid'])
+        node['netobjectid'] = 'N:{0}'.format(node['nodeid'])
+        node['unmanagefrom'] = _iso(result['UnManageFrom'])
+        node['unmanageuntil'] = _iso(result['UnManageUntil'])
+        return node
+
     def get_node(self):
-        node = {}
-        fields = """NodeID, Caption, Unmanaged, UnManageFrom, UnManageUntil, Uri,
-                  ObjectSubType, IP_Address, Status, StatusDescription, LastSystemUptimePollUtc"""
+        """Get the node selected by the module parameters, only querying SWIS until it is found."""
+        if self._node is None:
+            result = self._query_node()
+            if not result:
+                return {}
+            self._node = self._node_from_result(result)
+        return self._node
 
-        if self.module.params['node_id']:
-            results = self.swis.query(
-                "SELECT {0} FROM Orion.Nodes WHERE NodeID = '{1}'".format(fields, self.module.params['node_id'])
-            )
-        elif self.module.params['ip_address']:
-            results = self.swis.query(
-                "SELECT {0} FROM Orion.Nodes WHERE IPAddress = '{1}'".format(fields, self.module.params['ip_address'])
-            )
-        elif self.module.params['name']:
-            results = self.swis.query(
-                "SELECT {0} FROM Orion.Nodes WHERE Caption = '{1}'".format(fields, self.module.params['name'])
+    def invalidate_node(self):
+        """Drop the cached node, so the next get_node() queries SWIS again."""
+        self._node = None
+
+    def get_node_with_custom_property_values(self, prop_names):
+        """Get a node and the values of several of its custom properties with a single query.
+
+        The custom properties are read through the CustomProperties navigation property of Orion.Nodes,
+        so no separate Orion.NodesCustomProperties query is needed.
+
+        Returns
+        -------
+        tuple
+            The node dict, empty if the node was not found, and a dict of custom property values
+        """
+        extra_fields = []
+        for index, prop_name in enumerate(prop_names):
+            if not _IDENT_RE.match(prop_name):
+                raise ValueError('Invalid custom property name: {0}'.format(prop_name))
+            extra_fields.append(", CustomProperties.{0} AS CustomProperty{1}".format(prop_name, index))
+
+        result = self._query_node(''.join(extra_fields))
+        if result:
+            self._node = self._node_from_result(result)
+            prop_values = dict(
+                (prop_name, result['CustomProperty{0}'.format(index)]) for index, prop_name in enumerate(prop_names)
             )
+            return self._node, prop_values
+        return {}, {}
 
-        if results['results']:
-            node['nodeid'] = results['results'][0]['NodeID']
-            node['caption'] = results['results'][0]['Caption']
-            node['netobjectid'] = 'N:{0}'.format(node['nodeid'])
-            node['unmanaged'] = results['results'][0]['Unmanaged']
-            node['unmanagefrom'] = parse(results['results'][0]['UnManageFrom']).isoformat()
-            node['unmanageuntil'] = parse(results['results'][0]['UnManageUntil']).isoformat()
-            node['uri'] = results['results'][0]['Uri']
-            node['objectsubtype'] = results['results'][0]['ObjectSubType']
-            node['ipaddress'] = results['results'][0]['IP_Address']
-            node['status'] = results['results'][0]['Status']
-            node['statusdescription'] = results['results'][0]['StatusDescription']
-            node['lastsystemuptimepollutc'] = results['results'][0]['LastSystemUptimePollUtc']
-        return node
+    def get_node_with_hardware_health(self):
+        """Get a node and the polling method of its hardware health sensors with a single query.
+
+        Returns
+        -------
+        tuple
+            The node dict, empty if the node was not found, and the polling method ID,
+            None when hardware health isn't enabled on the node
+        """
+        for param, column in _NODE_SELECTORS:
+            if self.module.params[param]:
+                results = self.swis_query(_NODE_HARDWARE_HEALTH_QUERIES[param], value=self.module.params[param])
+                if results:
+                    self._node = self._node_from_result(results[0])
+                    return self._node, results[0]['HardwareHealthPollingMethod']
+                break
+        return {}, None
 
     def add_custom_property(self, node, prop_name, prop_value):
-        custom_property = {prop_name: prop_value}
-        self.swis.update(node['uri'] + '/CustomProperties', **custom_property)
+        self.update_custom_properties(node, {prop_name: prop_value})
+
+    def update_custom_properties(self, node, custom_properties):
+        """Set several custom properties of the node with a single update."""
+        self.swis.update(node['uri'] + '/CustomProperties', **custom_properties)
 
     def get_node_custom_property_value(self, node, prop_name):
-        custom_property_query = self.swis.query(
-            "SELECT {0} FROM Orion.NodesCustomProperties WHERE NodeId = {1}".format(prop_name, node['nodeid'])
+        if not _IDENT_RE.match(prop_name):
+            raise ValueError('Invalid custom property name: {0}'.format(prop_name))
+        custom_property_query = self.swis_query(
+            "SELECT {0} FROM Orion.NodesCustomProperties WHERE NodeId = @node_id".format(prop_name),
+            node_id=node['nodeid']
         )
-        return prop_name, custom_property_query['results'][0][prop_name]
+        return prop_name, custom_property_query[0][prop_name]
+
+    def remove_custom_properties(self, node, prop_names):
+        """Clear several custom properties of the node with a single update, by setting their values to None."""
+        self.update_custom_properties(node, dict((prop_name, None) for prop_name in prop_names))
 
     def get_poller(self, net_object_type, net_object_id, poller_name):
+        return self.get_pollers(net_object_type, net_object_id, [poller_name]).get(poller_name)
+
+    def get_pollers(self, net_object_type, net_object_id, poller_names=None):
+        """Get pollers of a net object with a single query, keyed by PollerType.
+
+        When poller_names is given, only those pollers are fetched, otherwise all of them.
+        """
         net_obj = '{0}:{1}'.format(net_object_type, net_object_id)
-        poller_query = self.swis.query(
-            "SELECT PollerType, Enabled, Uri FROM Orion.Pollers "
-            "WHERE NetObject = '{0}' AND PollerType = '{1}'".format(net_obj, poller_name)
-        )
+        query = "SELECT PollerType, Enabled, Uri FROM Orion.Pollers WHERE NetObject = @net_object"
+        params = {'net_object': net_obj}
+        if poller_names:
+            poller_binds = ['p{0}'.format(i) for i in range(len(poller_names))]
+            query += " AND PollerType IN ({0})".format(', '.join('@' + bind for bind in poller_binds))
+            params.update(zip(poller_binds, poller_names))
+        poller_query = self.swis_query(query, **params)
 
-        if poller_query['results']:
-            return poller_query['results'][0]
+        return dict((poller['PollerType'], poller) for poller in poller_query)
 
     def add_poller(self, net_object_type, net_object_id, poller_name, enabled):
         poller = {
@@ -158,6 +420,34 @@ class OrionModule:
         elif get_poller['Enabled'] != enabled:
             self.swis.update(get_poller['Uri'], **poller)
 
+    def add_pollers(self, net_object_type, net_object_id, pollers):
+        """Add or update several pollers of a net object, given as a dict of poller name to enabled state.
+
+        Existing pollers are fetched with one query and updated with one BulkUpdate per enabled state.
+        SWIS has no bulk create, so missing pollers are created concurrently through submit().
+        """
+        current_pollers = self.get_pollers(net_object_type, net_object_id, list(pollers))
+        update_uris = {}
+        create_futures = []
+        for poller_name, enabled in pollers.items():
+            current = current_pollers.get(poller_name)
+            if not current:
+                poller = {
+                    'PollerType': poller_name,
+                    'NetObject': '{0}:{1}'.format(net_object_type, net_object_id),
+                    'NetObjectType': net_object_type,
+                    'NetObjectID': net_object_id,
+                    'Enabled': enabled
+                }
+                create_futures.append(self.submit(self.swis.create, 'Orion.Pollers', **poller))
+            elif current['Enabled'] != enabled:
+                update_uris.setdefault(enabled, []).append(current['Uri'])
+
+        for enabled, uris in update_uris.items():
+            self.swis.bulkupdate(uris, Enabled=enabled)
+        for future in create_futures:
+            future.result()
+
     def remove_poller(self, net_object_type, net_object_id, poller_name):
         get_poller = self.get_poller(net_object_type, net_object_id, poller_name)
 
@@ -165,35 +455,62 @@ class OrionModule:
             self.swis.delete(get_poller['Uri'])
 
     def get_custom_poller_id(self, poller_name):
-        custom_poller_id = self.swis.query(
-            "SELECT CustomPollerID FROM Orion.NPM.CustomPollers WHERE UniqueName = '{0}'".format(poller_name)
+        if poller_name in self._poller_id_cache:
+            return self._poller_id_cache[poller_name]
+
+        custom_poller_id = self.swis_query(
+            "SELECT CustomPollerID FROM Orion.NPM.CustomPollers WHERE UniqueName = @poller_name",
+            poller_name=poller_name
         )
 
-        if custom_poller_id['results']:
-            return custom_poller_id['results'][0]['CustomPollerID']
+        if custom_poller_id:
+            return self._poller_id_cache.setdefault(poller_name, custom_poller_id[0]['CustomPollerID'])
 
     def get_custom_poller_uri(self, node, poller_name):
-        node_id = str(node['nodeid'])
-        custom_poller_uri = self.swis.query(
+        custom_poller_uri = self.swis_query(
             "SELECT Uri FROM Orion.NPM.CustomPollerAssignment "
-            "WHERE NodeID = '{0}' and CustomPollerName = '{1}'".format(node_id, poller_name)
+            "WHERE NodeID = @node_id and CustomPollerName = @poller_name",
+            node_id=node['nodeid'], poller_name=poller_name
         )
 
-        if custom_poller_uri['results']:
-            return custom_poller_uri['results'][0]['Uri']
+        if custom_poller_uri:
+            return custom_poller_uri[0]['Uri']
+
+    def get_custom_poller_assignment(self, node, poller_name):
+        """Look up a custom poller and its assignment to the node with a single query.
+
+        Returns
+        -------
+        tuple
+            The custom poller ID, None if the poller doesn't exist,
+            and the Uri of its assignment to the node, None if it isn't assigned
+        """
+        result = self.swis_query(
+            "SELECT cp.CustomPollerID, a.Uri FROM Orion.NPM.CustomPollers cp "
+            "LEFT JOIN Orion.NPM.CustomPollerAssignment a ON a.CustomPollerID = cp.CustomPollerID AND a.NodeID = @node_id "
+            "WHERE cp.UniqueName = @poller_name",
+            node_id=node['nodeid'], poller_name=poller_name
+        )
+
+        if not result:
+            return None, None
+        custom_poller_id = self._poller_id_cache.setdefault(poller_name, result[0]['CustomPollerID'])
+        return custom_poller_id, result[0]['Uri']
+
+    def assign_custom_poller(self, node, custom_poller_id):
+        poller_properties = {
+            'NodeID': node['nodeid'],
+            'customPollerID': custom_poller_id
+        }
+        self.swis.create('Orion.NPM.CustomPollerAssignmentOnNode', **poller_properties)
 
     def add_custom_poller(self, node, poller_name):
-        node_id = str(node['nodeid'])
         custom_poller_id = self.get_custom_poller_id(poller_name)
 
         custom_poller_uri = self.get_custom_poller_uri(node, poller_name)
 
         if not custom_poller_uri:
-            poller_properties = {
-                'NodeID': node_id,
-                'customPollerID': custom_poller_id
-            }
-            self.swis.create('Orion.NPM.CustomPollerAssignmentOnNode', **poller_properties)
+            self.assign_custom_poller(node, custom_poller_id)
 
     def remove_custom_poller(self, node, poller_name):
         custom_poller_uri = self.get_custom_poller_uri(node, poller_name)
@@ -203,55 +520,35 @@ class OrionModule:
 
     def get_volume(self, node, volume):
         volume_info = {}
-        fields = """volumeid, displayname, volumeindex, status, type, caption, pollinterval,
-                    statcollection, rediscoveryinterval, volumedescription, icon, uri"""
 
-        volume_query = self.swis.query(
-            "SELECT {0} FROM Orion.Volumes WHERE nodeid = '{1}' AND caption = '{2}'".format(
-                fields, str(node['nodeid']), str(volume['name'])
-            )
+        volume_query = self.swis_query(
+            _VOLUME_QUERY,
+            node_id=node['nodeid'], caption=str(volume['name'])
         )
 
-        if volume_query['results']:
-            volume_info['volumeid'] = volume_query['results'][0]['volumeid']
-            volume_info['displayname'] = volume_query['results'][0]['displayname']
-            volume_info['volumeindex'] = volume_query['results'][0]['volumeindex']
-            volume_info['status'] = volume_query['results'][0]['status']
-            volume_info['type'] = volume_query['results'][0]['type']
-            volume_info['caption'] = volume_query['results'][0]['caption']
-            volume_info['pollinterval'] = volume_query['results'][0]['pollinterval']
-            volume_info['statcollection'] = volume_query['results'][0]['statcollection']
-            volume_info['rediscoveryinterval'] = volume_query['results'][0]['rediscoveryinterval']
-            volume_info['volumedescription'] = volume_query['results'][0]['volumedescription']
-            volume_info['icon'] = volume_query['results'][0]['icon']
-            volume_info['uri'] = volume_query['results'][0]['uri']
+        if volume_query:
+            row = volume_query[0]
+            volume_info = {field: row[field] for field in _VOLUME_FIELDS}
         return volume_info
 
     def add_volume(self, node, volume):
         max_index = 0
-        volume_type_id = {
-            "Other": 1,
-            "RAM": 2,
-            "Virtual Memory": 3,
-            "Fixed Disk": 4,
-        }
 
-        volume_max_index_query = self.swis.query(
-            "SELECT MAX(VolumeIndex) as max_index FROM Orion.Volumes WHERE nodeid = '{0}'".format(
-                str(node['nodeid'])
-            )
+        volume_max_index_query = self.swis_query(
+            "SELECT MAX(VolumeIndex) as max_index FROM Orion.Volumes WHERE nodeid = @node_id",
+            node_id=node['nodeid']
         )
 
-        if volume_max_index_query['results'][0]['max_index']:
-            max_index = volume_max_index_query['results'][0]['max_index']
+        if volume_max_index_query[0]['max_index']:
+            max_index = volume_max_index_query[0]['max_index']
 
         if not volume['volumeDescription']:
             volume['volumeDescription'] = volume['name']
 
         volume_data = {
-            'NodeID': str(node['nodeid']),
+            'NodeID': node['nodeid'],
             'VolumeType': volume['volumeType'],
-            'VolumeTypeID': volume_type_id[volume['volumeType']],
+            'VolumeTypeID': _VOLUME_TYPE_ID[volume['volumeType']],
             'Icon': volume['volumeIcon'],
             'VolumeIndex': max_index + 1,
             'Caption': volume['name'],
@@ -277,21 +574,32 @@ class OrionModule:
         return discovered_interfaces['DiscoveredInterfaces']
 
     def get_interface(self, node, interface_name):
-        interface_uri = self.swis.query(
+        interface_uri = self.swis_query(
             "SELECT Uri FROM Orion.NPM.Interfaces "
-            "WHERE NodeID = '{0}' AND InterfaceName = '{1}'".format(node['nodeid'], interface_name)
+            "WHERE NodeID = @node_id AND InterfaceName = @interface_name",
+            node_id=node['nodeid'], interface_name=interface_name
         )
 
-        if interface_uri['results']:
-            return interface_uri['results'][0]['Uri']
+        if interface_uri:
+            return interface_uri[0]['Uri']
+
+    def get_interfaces(self, node):
+        """Get the Uri of every interface monitored on the node with a single query, keyed by InterfaceName."""
+        interfaces = self.swis_query(
+            "SELECT InterfaceName, Uri FROM Orion.NPM.Interfaces WHERE NodeID = @node_id",
+            node_id=node['nodeid']
+        )
+
+        return dict((interface['InterfaceName'], interface['Uri']) for interface in interfaces)
 
     def add_interface(self, node, interface_name, regex, discovered_interfaces):
         added_interfaces = []
         if regex:
+            matcher = re.compile(interface_name).search
             discovered_interface = [
                 x for x
                 in discovered_interfaces
-                if re.search(interface_name, x['Caption'])
+                if matcher(x['Caption'])
             ]
         else:
             discovered_interface = [
@@ -309,6 +617,15 @@ class OrionModule:
 
         return added_interfaces
 
+    def add_interfaces(self, node, discovered_interfaces):
+        """Add the discovered interfaces that aren't monitored yet to the node with a single invoke."""
+        new_interfaces = [interface for interface in discovered_interfaces if interface['InterfaceID'] == 0]
+        if not new_interfaces:
+            return []
+
+        add = self.swis.invoke('Orion.NPM.Interfaces', 'AddInterfacesOnNode', node['nodeid'], new_interfaces, 'AddDefaultPollers')
+        return add['DiscoveredInterfaces']
+
     def remove_interface(self, node, interface_name):
         interface_uri = self.get_interface(node, interface_name)
 
@@ -316,31 +633,74 @@ class OrionModule:
             self.swis.delete(interface_uri)
 
     def get_application_template_id(self, application_template_name):
+        if application_template_name in self._app_tpl_cache:
+            return self._app_tpl_cache[application_template_name]
 
-        app_template_id = self.swis.query(
-            "select ApplicationTemplateID from Orion.APM.ApplicationTemplate where name = '{0}'".format(application_template_name)
+        app_template_id = self.swis_query(
+            "select ApplicationTemplateID from Orion.APM.ApplicationTemplate where name = @application_template_name",
+            application_template_name=application_template_name
         )
 
-        if app_template_id['results']:
-            return app_template_id['results'][0]['ApplicationTemplateID']
+        if app_template_id:
+            return self._app_tpl_cache.setdefault(
+                application_template_name, app_template_id[0]['ApplicationTemplateID']
+            )
+
+    def get_credential_id(self, credential_name):
+        if credential_name in self._credential_cache:
+            return self._credential_cache[credential_name]
+
+        credential_id = self.swis_query(
+            "SELECT ID FROM Orion.Credential WHERE Name = @credential_name",
+            credential_name=credential_name
+        )
+
+        if credential_id:
+            return self._credential_cache.setdefault(credential_name, credential_id[0]['ID'])
 
     def get_apm_credential_id(self, credential_name):
+        if credential_name in self._apm_credential_cache:
+            return self._apm_credential_cache[credential_name]
 
-        credential_id = self.swis.query(
-            "select ID from Orion.Credential where CredentialOwner = 'APM' and Name = '{0}'".format(credential_name)
+        credential_id = self.swis_query(
+            "select ID from Orion.Credential where CredentialOwner = 'APM' and Name = @credential_name",
+            credential_name=credential_name
         )
 
-        if credential_id['results']:
-            return credential_id['results'][0]['ID']
+        if credential_id:
+            return self._apm_credential_cache.setdefault(credential_name, credential_id[0]['ID'])
 
     def get_application_id(self, node, application_name):
 
-        application = self.swis.query(
-            "select ApplicationID from Orion.APM.Application where nodeid = '{0}' and Name = '{1}'".format(node['nodeid'], application_name)
+        application = self.swis_query(
+            "select ApplicationID from Orion.APM.Application where nodeid = @node_id and Name = @application_name",
+            node_id=node['nodeid'], application_name=application_name
         )
 
-        if application['results']:
-            return application['results'][0]['ApplicationID']
+        if application:
+            return application[0]['ApplicationID']
+
+    def get_application_template_and_application_id(self, node, application_template_name):
+        """Look up an application template and the node's application created from it with a single query.
+
+        Returns
+        -------
+        tuple
+            The template ID and the application ID, each None when not found
+        """
+        result = self.swis_query(
+            "SELECT t.ApplicationTemplateID, a.ApplicationID FROM Orion.APM.ApplicationTemplate t "
+            "LEFT JOIN Orion.APM.Application a ON a.NodeID = @node_id AND a.Name = t.Name "
+            "WHERE t.Name = @application_template_name",
+            node_id=node['nodeid'], application_template_name=application_template_name
+        )
+
+        if not result:
+            return None, None
+        application_template_id = self._app_tpl_cache.setdefault(
+            application_template_name, result[0]['ApplicationTemplateID']
+        )
+        return application_template_id, result[0]['ApplicationID']
 
     def add_application_template_to_node(self, node, application_template_id, credential_set_id, skip_if_duplicate):
 
@@ -362,25 +722,26 @@ class OrionModule:
         return application
 
     def get_least_used_polling_engine(self):
-        queryengines = self.swis.query("SELECT count(EngineId) as NumEngines FROM Orion.Engines")
-        totalpollingengines = int(queryengines['results'][0]['NumEngines'])
+        queryleast = self.swis_query(
+            "SELECT TOP 1 Nodes, EngineID FROM Orion.Engines WHERE EngineID != 1 ORDER BY Nodes asc"
+        )
 
-        if totalpollingengines > 1:
-            queryleast = self.swis.query(
-                "SELECT TOP 1 Nodes, EngineID FROM Orion.Engines WHERE EngineID != 1 ORDER BY Nodes asc"
-            )
-            leastusedpollingengine = queryleast['results'][0]['EngineID']
-            return leastusedpollingengine
+        if queryleast:
+            return queryleast[0]['EngineID']
         else:
             return "1"
 
     def get_ncm_node(self, node):
-        cirrus_node_query = self.swis.query(
-            "SELECT NodeID from Cirrus.Nodes WHERE CoreNodeID = '{0}'".format(node['nodeid'])
+        if node['nodeid'] in self._ncm_node_cache:
+            return self._ncm_node_cache[node['nodeid']]
+
+        cirrus_node_query = self.swis_query(
+            "SELECT NodeID from Cirrus.Nodes WHERE CoreNodeID = @node_id",
+            node_id=node['nodeid']
         )
 
-        if cirrus_node_query['results']:
-            return cirrus_node_query['results'][0]['NodeID']
+        if cirrus_node_query:
+            return self._ncm_node_cache.setdefault(node['nodeid'], cirrus_node_query[0]['NodeID'])
 
     def update_ncm_node_connection_profile(self, profile_dict, new_connection_profile_name, ncm_node_id):
         """Retrieves an NCM node and alters its connection profile.
@@ -423,11 +784,14 @@ class OrionModule:
 
     def add_node_to_ncm(self, node):
         self.swis.invoke('Cirrus.Nodes', 'AddNodeToNCM', node['nodeid'])
+        self._ncm_node_cache.pop(node['nodeid'], None)
 
     def remove_node_from_ncm(self, node):
         cirrus_node_id = self.get_ncm_node(node)
 
         self.swis.invoke('Cirrus.Nodes', 'RemoveNode', cirrus_node_id)
+        self._ncm_node_cache.pop(node['nodeid'], None)
 
     def poll_now(self, node):
         self.swis.invoke('Orion.Nodes', 'PollNow', node['netobjectid'])
+        self.invalidate_node()
@@ -12,7 +12,7 @@ DOCUMENTATION = r'''
 module: orion_custom_property
 short_description: Manage custom properties on Node in Solarwinds Orion NPM
 description:
-    - Adds or removes a custom property on Node in Solarwinds Orion NPM.
+    - Adds or removes custom properties on Node in Solarwinds Orion NPM.
     - This module requires the custom property to already exist in Solarwinds settings.
 version_added: "1.0.0"
 author: "Josh M. Eisenbath (@jeisenbath)"
@@ -29,14 +29,24 @@ options:
     property_name:
         description:
             - Name of the custom property for the node.
-        required: True
+            - One of I(property_name) or I(properties) is required.
+        required: False
         type: str
     property_value:
         description:
             - Value to set for the custom property on the node.
-            - Required if I(state=present).
+            - Required if I(state=present) and I(property_name) is used.
         required: False
         type: str
+    properties:
+        description:
+            - Dictionary of custom property names and values to manage on the node.
+            - All properties are read with a single query and changed with a single update.
+            - When I(state=absent), only the names are used.
+            - Mutually exclusive with I(property_name).
+        required: False
+        type: dict
+        version_added: "2.2.0"
 extends_documentation_fragment:
     - solarwinds.orion.orion_auth_options
     - solarwinds.orion.orion_node_options
@@ -59,6 +69,18 @@ EXAMPLES = r'''
     property_value: EST
   delegate_to: localhost
 
+- name: Set several custom properties for node at once
+  solarwinds.orion.orion_custom_property:
+    hostname: "{{ solarwinds_server }}"
+    username: "{{ solarwinds_user }}"
+    password: "{{ solarwinds_pass }}"
+    name: "{{ node_name }}"
+    state: present
+    properties:
+      Timezone: EST
+      City: Villa Straylight
+  delegate_to: localhost
+
 '''
 
 RETURN = r'''
@@ -83,38 +105,30 @@ orion_node:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_text
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    import orionsdk
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
 
 
 def main():
     argument_spec = orion_argument_spec()
     argument_spec.update(
         state=dict(required=True, choices=['present', 'absent']),
-        property_name=dict(required=True, type='str'),
-        property_value=dict(required=False, type='str')
+        property_name=dict(required=False, type='str'),
+        property_value=dict(required=False, type='str'),
+        properties=dict(required=False, type='dict'),
     )
     module = AnsibleModule(
         argument_spec,
         supports_check_mode=True,
-        required_one_of=[('name', 'node_id', 'ip_address')],
+        required_one_of=[('name', 'node_id', 'ip_address'), ('property_name', 'properties')],
+        mutually_exclusive=[('property_name', 'properties')],
         required_if=[
-            ('state', 'present', ['property_value'])
+            ('state', 'present', ['property_value', 'properties'], True)
         ]
     )
 
@@ -123,34 +137,50 @@ def main():
 
     orion = OrionModule(module)
 
-    node = orion.get_node()
+    if module.params['properties']:
+        # Compared and set as text, like property_value
+        properties = dict(
+            (prop_name, None if prop_value is None else to_text(prop_value))
+            for prop_name, prop_value in module.params['properties'].items()
+        )
+    else:
+        properties = {module.params['property_name']: module.params['property_value']}
+
+    try:
+        node, prop_values = orion.get_node_with_custom_property_values(list(properties))
+    except Exception as OrionException:
+        module.fail_json(msg='Failed to get custom property of node: {0}'.format(OrionException))
     if not node:
         module.fail_json(skipped=True, msg='Node not found')
 
     if module.params['state'] == 'present':
         try:
-            prop_name, prop_value = orion.get_node_custom_property_value(node, module.params['property_name'])
-            if prop_value == module.params['property_value']:
+            changed_properties = dict(
+                (prop_name, prop_value) for prop_name, prop_value in properties.items()
+                if prop_values[prop_name] != prop_value
+            )
+            if not changed_properties:
                 module.exit_json(changed=False, orion_node=node)
             else:
                 if module.check_mode:
                     module.exit_json(changed=True, orion_node=node)
                 else:
-                    orion.add_custom_property(node, module.params['property_name'], module.params['property_value'])
+                    orion.update_custom_properties(node, changed_properties)
                     module.exit_json(changed=True, orion_node=node)
         except Exception as OrionException:
             module.fail_json(msg='Failed to add custom properties: {0}'.format(OrionException))
     elif module.params['state'] == 'absent':
         try:
-            prop_name, prop_value = orion.get_node_custom_property_value(node, module.params['property_name'])
-            if prop_value:
-                if module.check_mode:
-                    module.exit_json(changed=True, orion_node=node)
-                else:
-                    orion.add_custom_property(node, module.params['property_name'], None)
-                    module.exit_json(changed=True, orion_node=node)
-            else:
+            # Nothing to update when the properties are already unset
+            set_properties = [prop_name for prop_name in properties if prop_values[prop_name]]
+            if not set_properties:
                 module.exit_json(changed=False, orion_node=node)
+
+            if module.check_mode:
+                module.exit_json(changed=True, orion_node=node)
+            else:
+                orion.remove_custom_properties(node, set_properties)
+                module.exit_json(changed=True, orion_node=node)
         except Exception as OrionException:
             module.fail_json(msg='Failed to remove custom property from node: {0}'.format(OrionException))
     # TODO create/update custom properties and their values within solarwinds?
@@ -232,40 +232,30 @@ orion_node:
     }
 '''
 
+from datetime import datetime, timedelta
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    from datetime import datetime, timedelta
-    HAS_DATETIME = True
-except ImportError:
-    HAS_DATETIME = False
-except Exception:
-    raise Exception
-try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    import orionsdk
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
 
 
-def add_credential_set(node, credential_set_name, credential_set_type):
-    credential_set_type_valid = ['WMICredential', 'ROSNMPCredentialID', 'RWSNMPCredentialID']
-    cred_id_query = __SWIS__.query(
-        "SELECT ID FROM Orion.Credential WHERE Name = '{0}'".format(credential_set_name)
-    )
+# Node properties of SNMPv3 nodes, mapped to the module parameter and the default used when it isn't set
+SNMPV3_DEFAULTS = {
+    'SNMPV3PrivMethod': ('snmpv3_priv_method', 'AES128'),
+    'SNMPV3PrivKeyIsPwd': ('snmpv3_priv_key_is_pwd', True),
+    'SNMPV3AuthMethod': ('snmpv3_auth_method', 'SHA1'),
+    'SNMPV3AuthKeyIsPwd': ('snmpv3_auth_key_is_pwd', True),
+}
 
-    credential_id = cred_id_query['results'][0]['ID']
+
+def add_credential_set(orion, node, credential_set_name, credential_set_type):
+    credential_set_type_valid = ['WMICredential', 'ROSNMPCredentialID', 'RWSNMPCredentialID']
+    credential_id = orion.get_credential_id(credential_set_name)
+    if not credential_id:
+        orion.module.fail_json(msg='Credential set not found: {0}'.format(credential_set_name))
     if credential_id and credential_set_type in credential_set_type_valid:
         nodesettings = {
             'nodeid': node['nodeid'],
@@ -309,29 +299,15 @@ def add_node(module, orion):
         if module.params['snmpv3_auth_key']:
             props['SNMPV3AuthKey'] = module.params['snmpv3_auth_key']
 
-        # Set defaults here instead of at module level, since we only want for snmpv3 nodes
-        if module.params['snmpv3_priv_method']:
-            props['SNMPV3PrivMethod'] = module.params['snmpv3_priv_method']
-        else:
-            props['SNMPV3PrivMethod'] = 'AES128'
-        if module.params['snmpv3_priv_key_is_pwd']:
-            props['SNMPV3PrivKeyIsPwd'] = module.params['snmpv3_priv_key_is_pwd']
-        else:
-            props['SNMPV3PrivKeyIsPwd'] = True
-        if module.params['snmpv3_auth_method']:
-            props['SNMPV3AuthMethod'] = module.params['snmpv3_auth_method']
-        else:
-            props['SNMPV3AuthMethod'] = 'SHA1'
-        if module.params['snmpv3_auth_key_is_pwd']:
-            props['SNMPV3AuthKeyIsPwd'] = module.params['snmpv3_auth_key_is_pwd']
-        else:
-            props['SNMPV3AuthKeyIsPwd'] = True
+        # Set defaults here instead of in the argument spec, since we only want them for snmpv3 nodes
+        for prop, (param, default) in SNMPV3_DEFAULTS.items():
+            props[prop] = default if module.params[param] is None else module.params[param]
 
     # Add Node
     try:
         __SWIS__.create('Orion.Nodes', **props)
     except Exception as OrionException:
-        module.fail_json(msg='Failed to create node: {0}'.format(str(OrionException)))
+        module.fail_json(msg='Failed to create node: {0}'.format(OrionException))
 
     # Get node after being created
     node = orion.get_node()
@@ -339,11 +315,11 @@ def add_node(module, orion):
     # If we don't use credential sets, each snmpv3 node will create its own credential set
     # TODO option for read/write sets?
     if props['ObjectSubType'] == 'SNMP' and props['SNMPVersion'] == '3' and module.params['snmpv3_credential_set']:
-        add_credential_set(node, module.params['snmpv3_credential_set'], 'ROSNMPCredentialID')
+        add_credential_set(orion, node, module.params['snmpv3_credential_set'], 'ROSNMPCredentialID')
 
     # If Node is a WMI node, assign credential
     if props['ObjectSubType'] == 'WMI':
-        add_credential_set(node, module.params['wmi_credential_set'], 'WMICredential')
+        add_credential_set(orion, node, module.params['wmi_credential_set'], 'WMICredential')
 
     # Add Standard Default Pollers
     icmp_pollers = {
@@ -370,11 +346,11 @@ def add_node(module, orion):
     else:
         pollers_enabled = {}
 
-    for k in pollers_enabled:
-        try:
-            orion.add_poller('N', str(node['nodeid']), k, pollers_enabled[k])
-        except Exception as OrionException:
-            module.fail_json(msg='Failed to create pollers on node: {0}'.format(str(OrionException)))
+    try:
+        if pollers_enabled:
+            orion.add_pollers('N', node['nodeid'], pollers_enabled)
+    except Exception as OrionException:
+        module.fail_json(msg='Failed to create pollers on node: {0}'.format(OrionException))
 
     return node
 
@@ -384,7 +360,7 @@ def remove_node(module, node):
         __SWIS__.delete(node['uri'])
         module.exit_json(changed=True, orion_node=node)
     except Exception as OrionException:
-        module.fail_json(msg='Error removing node: {0}'.format(str(OrionException)))
+        module.fail_json(msg='Error removing node: {0}'.format(OrionException))
 
 
 def remanage_node(module, node):
@@ -395,23 +371,23 @@ def remanage_node(module, node):
         __SWIS__.invoke('Orion.Nodes', 'Remanage', node['netobjectid'])
         module.exit_json(changed=True, orion_node=node)
     except Exception as OrionException:
-        module.fail_json(msg='Error remanaging node: {0}'.format(str(OrionException)))
+        module.fail_json(msg='Error remanaging node: {0}'.format(OrionException))
 
 
 def unmanage_node(module, node):
-    now = datetime.now()
-    tomorrow = now + timedelta(days=1)
+    if node['unmanaged']:
+        module.exit_json(changed=False, orion_node=node)
 
     unmanage_from = module.params['unmanage_from']
     unmanage_until = module.params['unmanage_until']
 
+    # Only read the clock when a default is needed
+    if not unmanage_from or not unmanage_until:
+        now = datetime.now()
     if not unmanage_from:
         unmanage_from = now.isoformat()
     if not unmanage_until:
-        unmanage_until = tomorrow.isoformat()
-
-    elif node['unmanaged']:
-        module.exit_json(changed=False, orion_node=node)
+        unmanage_until = (now + timedelta(days=1)).isoformat()
 
     try:
         __SWIS__.invoke(
@@ -424,20 +400,20 @@ def unmanage_node(module, node):
         )
         module.exit_json(changed=True, orion_node=node)
     except Exception as OrionException:
-        module.fail_json(msg='Error unmanaging node: {0}'.format(str(OrionException)))
+        module.fail_json(msg='Error unmanaging node: {0}'.format(OrionException))
 
 
 def mute_node(module, node):
-    now = datetime.now()
-    tomorrow = now + timedelta(days=1)
-
     unmanage_from = module.params['unmanage_from']
     unmanage_until = module.params['unmanage_until']
 
+    # Only read the clock when a default is needed
+    if not unmanage_from or not unmanage_until:
+        now = datetime.now()
     if not unmanage_from:
         unmanage_from = now.isoformat()
     if not unmanage_until:
-        unmanage_until = tomorrow.isoformat()
+        unmanage_until = (now + timedelta(days=1)).isoformat()
 
     try:
         suppressed_state = __SWIS__.invoke('Orion.AlertSuppression', 'GetAlertSuppressionState', [node['uri']])[0]
@@ -450,7 +426,7 @@ def mute_node(module, node):
         else:
             module.exit_json(changed=False, orion_node=node)
     except Exception as OrionException:
-        module.fail_json(msg='Error muting node: {0}'.format(str(OrionException)))
+        module.fail_json(msg='Error muting node: {0}'.format(OrionException))
 
 
 def unmute_node(module, node):
@@ -464,7 +440,16 @@ def unmute_node(module, node):
             __SWIS__.invoke('Orion.AlertSuppression', 'ResumeAlerts', [node['uri']])
             module.exit_json(changed=True, orion_node=node)
     except Exception as OrionException:
-        module.fail_json(msg='Error muting node: {0}'.format(str(OrionException)))
+        module.fail_json(msg='Error unmuting node: {0}'.format(OrionException))
+
+
+# Handlers for the states that act on an existing node
+STATE_ACTIONS = {
+    'managed': remanage_node,
+    'unmanaged': unmanage_node,
+    'muted': mute_node,
+    'unmuted': unmute_node,
+}
 
 
 def main():
@@ -535,26 +520,10 @@ def main():
         if not node:
             module.exit_json(skipped=True, msg='Node not found')
 
-        if module.params['state'] == 'managed':
-            if module.check_mode:
-                module.exit_json(changed=True, orion_node=node)
-            else:
-                remanage_node(module, node)
-        elif module.params['state'] == 'unmanaged':
-            if module.check_mode:
-                module.exit_json(changed=True, orion_node=node)
-            else:
-                unmanage_node(module, node)
-        elif module.params['state'] == 'muted':
-            if module.check_mode:
-                module.exit_json(changed=True, orion_node=node)
-            else:
-                mute_node(module, node)
-        elif module.params['state'] == 'unmuted':
-            if module.check_mode:
-                module.exit_json(changed=True, orion_node=node)
-            else:
-                unmute_node(module, node)
+        if module.check_mode:
+            module.exit_json(changed=True, orion_node=node)
+        else:
+            STATE_ACTIONS[module.params['state']](module, node)
 
 
 if __name__ == "__main__":
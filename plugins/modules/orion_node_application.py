@@ -90,21 +90,10 @@ orion_node:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    import orionsdk
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
 
 
 def main():
@@ -126,22 +115,30 @@ def main():
 
     orion = OrionModule(module)
 
+    # The credential doesn't depend on the node or template, so its query is sent alongside theirs
+    credential_future = None
+    if module.params['state'] == 'present' and module.params['credential_name']:
+        credential_future = orion.submit(orion.get_apm_credential_id, module.params['credential_name'])
+
     node = orion.get_node()
     if not node:
         module.fail_json(skipped=True, msg='Node not found')
 
     if module.params['state'] == 'present':
         try:
-            application_template_id = orion.get_application_template_id(module.params['application_template_name'])
+            application_template_id, application_id = orion.get_application_template_and_application_id(
+                node, module.params['application_template_name']
+            )
+            if application_template_id is None:
+                module.fail_json(msg="Application template '{0}' not found".format(module.params['application_template_name']))
 
             credential_id = "-4"
-            if module.params['credential_name']:
+            if credential_future:
                 try:
-                    credential_id = orion.get_apm_credential_id(module.params['credential_name'])
+                    credential_id = credential_future.result()
                 except Exception as OrionException:
                     module.fail_json(msg='Failed to query credential name: {0}'.format(OrionException))
 
-            application_id = orion.get_application_id(node, module.params['application_template_name'])
             if application_id:
                 module.exit_json(changed=False, orion_node=node)
             else:
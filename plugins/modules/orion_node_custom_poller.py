@@ -78,21 +78,10 @@ orion_node:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    import orionsdk
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
 
 
 def main():
@@ -116,36 +105,39 @@ def main():
     if not node:
         module.fail_json(skipped=True, msg='Node not found')
 
+    try:
+        # The poller and its assignment to the node are read in one query
+        custom_poller_id, custom_poller_uri = orion.get_custom_poller_assignment(node, module.params['custom_poller'])
+    except Exception as OrionException:
+        module.fail_json(msg='Failed to query for custom poller: {0}'.format(OrionException))
+
     if module.params['state'] == 'present':
-        try:
-            if not orion.get_custom_poller_id(module.params['custom_poller']):
-                module.fail_json(msg='Custom poller {0} not found.'.format(module.params['custom_poller']))
-        except Exception as OrionException:
-            module.fail_json(msg='Failed to query for custom poller: {0}'.format(str(OrionException)))
+        if not custom_poller_id:
+            module.fail_json(msg='Custom poller {0} not found.'.format(module.params['custom_poller']))
 
         try:
-            if orion.get_custom_poller_uri(node, module.params['custom_poller']):
+            if custom_poller_uri:
                 module.exit_json(changed=False, orion_node=node)
             else:
                 if module.check_mode:
                     module.exit_json(changed=True, orion_node=node)
                 else:
-                    orion.add_custom_poller(node, module.params['custom_poller'])
+                    orion.assign_custom_poller(node, custom_poller_id)
                     module.exit_json(changed=True, orion_node=node)
         except Exception as OrionException:
-            module.fail_json(msg='Failed to create custom poller: {0}'.format(str(OrionException)))
+            module.fail_json(msg='Failed to create custom poller: {0}'.format(OrionException))
     elif module.params['state'] == 'absent':
         try:
-            if not orion.get_custom_poller_uri(node, module.params['custom_poller']):
+            if not custom_poller_uri:
                 module.exit_json(changed=False, orion_node=node)
             else:
                 if module.check_mode:
                     module.exit_json(changed=True, orion_node=node)
                 else:
-                    orion.remove_custom_poller(node, module.params['custom_poller'])
+                    orion.swis.delete(custom_poller_uri)
                     module.exit_json(changed=True, orion_node=node)
         except Exception as OrionException:
-            module.fail_json(msg='Failed to remove custom poller: {0}'.format(str(OrionException)))
+            module.fail_json(msg='Failed to remove custom poller: {0}'.format(OrionException))
     # TODO create custom pollers
     else:
         module.exit_json(changed=False)
@@ -99,15 +99,7 @@ orion_node:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORIONSDK = True
 except ImportError:
     HAS_ORIONSDK = False
@@ -134,13 +126,14 @@ POLLING_METHOD_MAP = {
     'Forwarded': 17,
     'SnmpArista': 18
 }
+POLLING_METHOD_CHOICES = list(POLLING_METHOD_MAP)
 
 
 def main():
     argument_spec = orion_argument_spec()
     argument_spec.update(
         state=dict(required=True, choices=['present', 'absent']),
-        polling_method=dict(type='str', required=False, choices=list(POLLING_METHOD_MAP.keys())),  # Not required for absent state
+        polling_method=dict(type='str', required=False, choices=POLLING_METHOD_CHOICES),  # Not required for absent state
     )
     module = AnsibleModule(
         argument_spec,
@@ -155,25 +148,25 @@ def main():
         module.fail_json(msg="The orionsdk module is required")
 
     orion = OrionModule(module)
-    node = orion.get_node()
+    # The node and its hardware health polling method are read in one query
+    node, hh_polling_method = orion.get_node_with_hardware_health()
     if not node:
         module.fail_json(skipped=True, msg='Node not found')
     changed = False
 
     try:
-        hh_poller = orion.swis_query("SELECT PollingMethod FROM Orion.HardwareHealth.HardwareInfoBase WHERE ParentObjectID = '{0}'".format(node['nodeid']))
         if module.params['state'] == 'present':
             polling_method_id = POLLING_METHOD_MAP[module.params['polling_method']]
-            if not hh_poller:
+            if hh_polling_method is None:
                 if module.check_mode:
                     changed = True
                 else:
                     orion.swis.invoke('Orion.HardwareHealth.HardwareInfoBase', 'EnableHardwareHealth', node['netobjectid'], polling_method_id)
                     changed = True
-            elif hh_poller[0]['PollingMethod'] != polling_method_id:
+            elif hh_polling_method != polling_method_id:
                 module.fail_json(msg="HardwareHealth montior exists, but does not match provided polling_method parameter.")
         elif module.params['state'] == 'absent':
-            if hh_poller:
+            if hh_polling_method is not None:
                 if module.check_mode:
                     changed = True
                 else:
@@ -61,28 +61,10 @@ from datetime import datetime
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    from dateutil import parser
-    HAS_DATEUTIL = True
-except ImportError:
-    HAS_DATEUTIL = False
-except Exception:
-    raise Exception
-try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    import orionsdk
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
 
 
 def main():
@@ -108,6 +90,8 @@ def main():
             orion.poll_now(node)
             node = orion.get_node()
         elif last_poll:
+            # Only imported when a poll time has to be compared
+            from dateutil import parser
             time_since_poll = parser.parse(last_poll).replace(tzinfo=None) - datetime.utcnow()
             if time_since_poll.seconds > 300:
                 orion.poll_now(node)
@@ -151,21 +151,10 @@ interfaces:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    import orionsdk
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
 
 
 def main():
@@ -196,12 +185,12 @@ def main():
     if module.params['state'] == 'present':
         try:
             if not module.params['interface']:
-                for interface in discovered:
-                    if not orion.get_interface(node, interface['Caption']):
-                        changed = True
-                        interfaces.append(interface)
-                        if not module.check_mode:
-                            orion.add_interface(node, interface['Caption'], False, discovered)
+                monitored = orion.get_interfaces(node)
+                interfaces = [interface for interface in discovered if interface['Caption'] not in monitored]
+                if interfaces:
+                    changed = True
+                    if not module.check_mode:
+                        orion.add_interfaces(node, interfaces)
             else:
                 get_int = orion.get_interface(node, module.params['interface'])
                 if not get_int:
@@ -212,16 +201,20 @@ def main():
                         if interfaces:
                             changed = True
         except Exception as OrionException:
-            module.fail_json(msg='Failed to add interfaces: {0}'.format(str(OrionException)))
+            module.fail_json(msg='Failed to add interfaces: {0}'.format(OrionException))
     elif module.params['state'] == 'absent':
         try:
             if not module.params['interface']:
+                monitored = orion.get_interfaces(node)
+                interface_uris = []
                 for interface in discovered:
-                    if orion.get_interface(node, interface['Caption']):
-                        changed = True
+                    if interface['Caption'] in monitored:
                         interfaces.append(interface)
-                        if not module.check_mode:
-                            orion.remove_interface(node, interface['Caption'])
+                        interface_uris.append(monitored.pop(interface['Caption']))
+                if interface_uris:
+                    changed = True
+                    if not module.check_mode:
+                        orion.swis.bulkdelete(interface_uris)
             else:
                 get_int = orion.get_interface(node, module.params['interface'])
                 if get_int:
@@ -231,7 +224,7 @@ def main():
                         orion.remove_interface(node, module.params['interface'])
 
         except Exception as OrionException:
-            module.fail_json(msg='Failed to remove interface: {0}'.format(str(OrionException)))
+            module.fail_json(msg='Failed to remove interface: {0}'.format(OrionException))
 
     module.exit_json(changed=changed, orion_node=node, discovered=discovered, interfaces=interfaces)
 
@@ -87,21 +87,10 @@ interfaces:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    import orionsdk
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
 
 
 def main():
@@ -123,13 +112,13 @@ def main():
 
     interfaces = []
     try:
-        interface_query = orion.swis.query(
+        interfaces = orion.swis_query(
             "SELECT Caption, Name, InterfaceID, AdminStatus, OperStatus, Speed, Type, Status, StatusDescription "
-            "FROM Orion.NPM.Interfaces WHERE NodeID = '{0}'".format(node['nodeid'])
+            "FROM Orion.NPM.Interfaces WHERE NodeID = @node_id",
+            node_id=node['nodeid']
         )
-        interfaces = interface_query['results']
     except Exception as e:
-        module.fail_json(msg="Failed to retrieve interfaces: {0}".format(str(e)))
+        module.fail_json(msg="Failed to retrieve interfaces: {0}".format(e))
 
     module.exit_json(changed=False, orion_node=node, interfaces=interfaces)
 
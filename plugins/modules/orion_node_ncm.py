@@ -77,21 +77,10 @@ orion_node:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    import orionsdk
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
 
 
 def index_connection_profiles(orion_module):
@@ -131,17 +120,25 @@ def main():
         # if get_node() returns None, there's no node
         module.fail_json(skipped=True, msg='Node not found')
 
+    profile_name = module.params['profile_name']
+    if module.params['state'] == 'present':
+        # Connection profiles don't depend on the NCM node, so fetch them while it is looked up
+        profile_future = orion.submit(index_connection_profiles, orion)
+    try:
+        ncm_node = orion.get_ncm_node(node)
+    except Exception as OrionException:
+        module.fail_json(msg='Failed to get NCM node: {0}'.format(OrionException))
+
     if module.params['state'] == 'present':
         try:
-            ncm_node = orion.get_ncm_node(node)
             if ncm_node:
-                profile_dict = index_connection_profiles(orion)
+                profile_dict = profile_future.result()
                 if module.check_mode:
-                    if orion.get_ncm_node_object(ncm_node)['ConnectionProfile'] != profile_dict[module.params['profile_name']]:
+                    if orion.get_ncm_node_object(ncm_node)['ConnectionProfile'] != profile_dict[profile_name]:
                         module.exit_json(changed=True, orion_node=node, msg="Check mode: no changes made.")
                     else:
                         module.exit_json(changed=False, orion_node=node)
-                was_changed = orion.update_ncm_node_connection_profile(profile_dict, module.params['profile_name'], ncm_node)
+                was_changed = orion.update_ncm_node_connection_profile(profile_dict, profile_name, ncm_node)
                 if was_changed:
                     module.exit_json(changed=True, orion_node=node)
                 else:
@@ -155,9 +152,9 @@ def main():
                     orion.add_node_to_ncm(node)
                     # collect the NCM node ID of the node
                     ncm_node = orion.get_ncm_node(node)
-                    profile_dict = index_connection_profiles(orion)
+                    profile_dict = profile_future.result()
                     # update the connection profile
-                    was_changed = orion.update_ncm_node_connection_profile(profile_dict, module.params['profile_name'], ncm_node)
+                    was_changed = orion.update_ncm_node_connection_profile(profile_dict, profile_name, ncm_node)
                     module.exit_json(changed=True, orion_node=node)
                     if was_changed:
                         module.exit_json(changed=True, orion_node=node)
@@ -168,7 +165,6 @@ def main():
 
     elif module.params['state'] == 'absent':
         try:
-            ncm_node = orion.get_ncm_node(node)
             if ncm_node:
                 if module.check_mode:
                     module.exit_json(changed=True, orion_node=node)
@@ -109,21 +109,10 @@ orion_node:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    import orionsdk
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
 
 
 def main():
@@ -150,31 +139,31 @@ def main():
 
     if module.params['state'] == 'present':
         try:
-            poller = orion.get_poller('N', str(node['nodeid']), module.params['poller'])
+            poller = orion.get_poller('N', node['nodeid'], module.params['poller'])
             if poller and poller['Enabled'] == module.params['enabled']:
                 module.exit_json(changed=False, orion_node=node)
             else:
                 if module.check_mode:
                     module.exit_json(changed=True, orion_node=node)
                 else:
-                    orion.add_poller('N', str(node['nodeid']), module.params['poller'], module.params['enabled'])
+                    orion.add_poller('N', node['nodeid'], module.params['poller'], module.params['enabled'])
                     module.exit_json(changed=True, orion_node=node)
         except Exception as OrionException:
-            module.fail_json(msg='Failed to add poller: {0}'.format(str(OrionException)))
+            module.fail_json(msg='Failed to add poller: {0}'.format(OrionException))
 
     elif module.params['state'] == 'absent':
         try:
-            poller = orion.get_poller('N', str(node['nodeid']), module.params['poller'])
+            poller = orion.get_poller('N', node['nodeid'], module.params['poller'])
             if poller:
                 if module.check_mode:
                     module.exit_json(changed=True, orion_node=node)
                 else:
-                    orion.remove_poller('N', str(node['nodeid']), module.params['poller'])
+                    orion.remove_poller('N', node['nodeid'], module.params['poller'])
                     module.exit_json(changed=True, orion_node=node)
             else:
                 module.exit_json(changed=False, orion_node=node)
         except Exception as OrionException:
-            module.fail_json(msg='Failed to remove poller: {0}'.format(str(OrionException)))
+            module.fail_json(msg='Failed to remove poller: {0}'.format(OrionException))
 
     module.exit_json(changed=False)
 
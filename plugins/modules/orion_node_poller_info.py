@@ -89,21 +89,10 @@ pollers:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    import orionsdk
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
 
 
 def main():
@@ -123,8 +112,8 @@ def main():
     if node:
         query = """SELECT p.PollerType, p.Enabled
          from Orion.Nodes n left join Orion.Pollers as p on p.NetObjectID = n.NodeId
-          where n.NodeId = '{0}'""".format(node['nodeid'])
-        pollers = orion.swis_query(query)
+          where n.NodeId = @node_id"""
+        pollers = orion.swis_query(query, node_id=node['nodeid'])
 
     module.exit_json(changed=False, orion_node=node, pollers=pollers)
 
@@ -102,21 +102,10 @@ orion_node:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    import orionsdk
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
 
 
 def main():
@@ -148,7 +137,7 @@ def main():
             orion.swis.update(node['uri'], **module.params['properties'])
             changed = True
     except Exception as OrionException:
-        module.fail_json(msg='Failed to update {0}'.format(str(OrionException)))
+        module.fail_json(msg='Failed to update {0}'.format(OrionException))
 
     module.exit_json(changed=changed, orion_node=node)
 
@@ -134,21 +134,10 @@ orion_volume:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.solarwinds.orion.plugins.module_utils.orion import OrionModule, orion_argument_spec
 try:
-    import requests
-    HAS_REQUESTS = True
-    requests.packages.urllib3.disable_warnings()
-except ImportError:
-    HAS_REQUESTS = False
-except Exception:
-    raise Exception
-try:
-    import orionsdk
-    from orionsdk import SwisClient
+    import orionsdk  # noqa: F401
     HAS_ORION = True
 except ImportError:
     HAS_ORION = False
-except Exception:
-    raise Exception
 
 
 def main():
@@ -202,7 +191,7 @@ def main():
                     orion.add_poller('V', str(volume['volumeid']), 'V.Statistics.SNMP.Generic', True)
                     module.exit_json(changed=True, orion_node=node, orion_volume=volume)
             except Exception as OrionException:
-                module.fail_json(msg='Failed to add volume: {0}'.format(str(OrionException)))
+                module.fail_json(msg='Failed to add volume: {0}'.format(OrionException))
     elif module.params['state'] == 'absent':
         if not volume:
             module.exit_json(changed=False, orion_node=node, orion_volume=volume)
@@ -214,7 +203,7 @@ def main():
                     orion.remove_volume(node, module.params['volume'])
                     module.exit_json(changed=True, orion_node=node, orion_volume=volume)
             except Exception as OrionException:
-                module.fail_json(msg='Failed to remove volume: {0}'.format(str(OrionException)))
+                module.fail_json(msg='Failed to remove volume: {0}'.format(OrionException))
     else:
         module.exit_json(changed=False)
 
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.solarwinds.orion.plugins.inventory.orion_nodes_inventory import InventoryModule
+
+
+class FakeDisplay:
+    verbosity = 0
+
+    def vvv(self, msg):
+        pass
+
+
+@pytest.fixture
+def inventory():
+    def get_query(**options):
+        plugin = InventoryModule()
+        plugin.display = FakeDisplay()
+        config = {
+            'hostname_field': 'DNS',
+            'hostvar_fields': [],
+            'hostvar_custom_properties': [],
+            'filter': None,
+            'page_size': 1000,
+        }
+        config.update(options)
+        plugin.get_option = config.get
+        return plugin.get_query()
+    return get_query
+
+
+def test_where_filter_is_paged(inventory):
+    query, page_size, strip_node_id = inventory(filter="WHERE Vendor = 'Cisco'")
+
+    assert page_size == 1000
+    assert query.endswith(
+        "FROM Orion.Nodes as node WHERE node.NodeID > @last_node_id AND node.DNS IS NOT NULL AND node.DNS <> '' "
+        "AND (Vendor = 'Cisco') ORDER BY node.NodeID"
+    )
+
+
+def test_where_filter_with_order_by(inventory):
+    query, page_size, strip_node_id = inventory(filter="WHERE Vendor = 'Cisco' ORDER BY Caption")
+
+    assert page_size == 0
+    assert query.endswith(
+        "FROM Orion.Nodes as node WHERE node.DNS IS NOT NULL AND node.DNS <> '' AND (Vendor = 'Cisco') ORDER BY Caption"
+    )
+
+
+def test_join_filter_goes_before_where(inventory):
+    query, page_size, strip_node_id = inventory(
+        filter="INNER JOIN Orion.NodesCustomProperties c ON c.NodeID = node.NodeID WHERE c.City = 'X'"
+    )
+
+    assert page_size == 0
+    assert query == (
+        "SELECT node.DNS FROM Orion.Nodes as node "
+        "INNER JOIN Orion.NodesCustomProperties c ON c.NodeID = node.NodeID "
+        "WHERE node.DNS IS NOT NULL AND node.DNS <> '' AND (c.City = 'X')"
+    )
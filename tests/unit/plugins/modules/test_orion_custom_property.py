@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+
+import pytest
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from ansible_collections.solarwinds.orion.plugins.modules import orion_custom_property
+
+try:
+    from unittest.mock import MagicMock, patch
+except ImportError:
+    from mock import MagicMock, patch
+
+
+NODE = {'nodeid': 1, 'caption': 'node1', 'uri': 'swis://orion/Orion/Orion.Nodes/NodeID=1'}
+
+
+class AnsibleExitJson(SystemExit):
+    """Raised in place of exit_json, a SystemExit like the real one so the module's except Exception doesn't catch it."""
+
+
+def exit_json(*args, **kwargs):
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):
+    pytest.fail(kwargs['msg'])
+
+
+def set_module_args(args):
+    args.update(hostname='orion', username='admin', password='secret')
+    basic._ANSIBLE_ARGS = to_bytes(json.dumps({'ANSIBLE_MODULE_ARGS': args}))
+    # ansible-core 2.19 only reads _ANSIBLE_ARGS with the legacy serialization profile
+    basic._ANSIBLE_PROFILE = 'legacy'
+
+
+def run_module(args, prop_values):
+    set_module_args(args)
+    orion = MagicMock()
+    orion.get_node_with_custom_property_values.return_value = (NODE, prop_values)
+    with patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json):
+        with patch.object(orion_custom_property, 'OrionModule', return_value=orion):
+            with pytest.raises(AnsibleExitJson) as result:
+                orion_custom_property.main()
+    return result.value.args[0], orion
+
+
+def test_properties_compared_as_text():
+    result, orion = run_module(
+        {'name': 'node1', 'state': 'present', 'properties': {'Rack': 12, 'Room': 'A'}},
+        {'Rack': '12', 'Room': 'A'},
+    )
+
+    assert result['changed'] is False
+    orion.update_custom_properties.assert_not_called()
+
+
+def test_properties_updated_as_text():
+    result, orion = run_module(
+        {'name': 'node1', 'state': 'present', 'properties': {'Rack': 12, 'Room': 'A'}},
+        {'Rack': '11', 'Room': 'A'},
+    )
+
+    assert result['changed'] is True
+    orion.update_custom_properties.assert_called_once_with(NODE, {'Rack': '12'})